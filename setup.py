@@ -0,0 +1,34 @@
+"""
+Bhagwad Programming Language - Optional native build
+Compiles the parser and transpiler to C extensions with mypyc:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+The extensions are picked up in place of src/parser.py and
+src/transpiler.py; delete the built files to go back to pure Python.
+This script only builds them in place and installs no package.
+"""
+
+import sys
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    sys.exit("setup.py builds the optional mypyc extensions and needs mypy: "
+             "pip install mypy")
+
+setup(
+    name='bhagwad',
+    python_requires='>=3.10',
+    # Nothing to install; the interpreter runs from the checkout
+    packages=[],
+    py_modules=[],
+    ext_modules=mypycify([
+        # Report type errors only for the compiled modules
+        '--follow-imports=silent',
+        'src/parser.py',
+        'src/transpiler.py',
+    ]),
+)
@@ -6,11 +6,7 @@ A spiritual programming language inspired by the Bhagavad Gītā
  Bhagwad guides the programmer toward computational enlightenment."
 """
 
-from .lexer import BhagwadLexer, Token, TokenType
-from .parser import BhagwadParser, parse_bhagwad, ParseError
-from .transpiler import BhagwadTranspiler, transpile_bhagwad
-from .interpreter import BhagwadInterpreter
-from . import ast_nodes
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Inspired by the eternal wisdom of the Bhagavad Gītā"
@@ -23,16 +19,58 @@ SACRED_NUMBERS = {
     'TRINITY': 3    # Creator, Preserver, Destroyer
 }
 
+# Public names and the submodule that defines them; loaded on first access
+_LAZY_EXPORTS = {
+    'BhagwadLexer': 'lexer',
+    'Token': 'lexer',
+    'TokenType': 'lexer',
+    'BhagwadParser': 'parser',
+    'parse_bhagwad': 'parser',
+    'ParseError': 'parser',
+    'BhagwadTranspiler': 'transpiler',
+    'transpile_bhagwad': 'transpiler',
+    'BhagwadInterpreter': 'interpreter',
+}
+
+def __getattr__(name: str):
+    """Import submodules lazily (PEP 562)"""
+    if name == 'ast_nodes':
+        return importlib.import_module('.ast_nodes', __name__)
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module('.' + _LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+# Shared interpreter for the convenience functions below, so its caches
+# are reused across calls
+_DEFAULT_INTERPRETER = None
+
+def _default_interpreter():
+    global _DEFAULT_INTERPRETER
+    if _DEFAULT_INTERPRETER is None:
+        from .interpreter import BhagwadInterpreter
+        _DEFAULT_INTERPRETER = BhagwadInterpreter()
+    return _DEFAULT_INTERPRETER
+
 def execute_bhagwad(source: str, debug: bool = False):
     """Execute Bhagwad source code directly"""
-    interpreter = BhagwadInterpreter()
-    interpreter.set_debug(debug)
+    if debug:
+        # Debug runs get their own interpreter so the shared one stays quiet
+        from .interpreter import BhagwadInterpreter
+        interpreter = BhagwadInterpreter()
+        interpreter.set_debug(True)
+    else:
+        interpreter = _default_interpreter()
     interpreter.execute_source(source)
 
 def compile_bhagwad(source: str) -> str:
     """Compile Bhagwad source code to Python"""
-    interpreter = BhagwadInterpreter()
-    return interpreter.interpret_source(source)
+    return _default_interpreter().interpret_source(source)
 
 __all__ = [
     'BhagwadLexer', 'BhagwadParser', 'BhagwadTranspiler', 'BhagwadInterpreter',
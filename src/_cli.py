@@ -0,0 +1,138 @@
+"""
+Bhagwad Programming Language - Command Line Interface
+Shared by bhagwad.py and the interpreter module's main()
+Inspired by the Bhagavad Gītā
+"""
+
+import os
+from typing import List
+from .interpreter import BhagwadInterpreter
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+
+def list_examples(examples_dir: str = EXAMPLES_DIR) -> List[str]:
+    """Return the sorted .bhagwad file names in the examples directory"""
+    with os.scandir(examples_dir) as entries:
+        return sorted(entry.name for entry in entries
+                      if entry.name.endswith('.bhagwad') and entry.is_file())
+
+def run(argv: List[str]):
+    """Run the Bhagwad command line with the given argument vector"""
+    print("🕉️  Welcome to Bhagwad Programming Language")
+    print("   Inspired by the eternal wisdom of the Bhagavad Gītā")
+    print("   'Just as the Gītā guides the soul toward moksha,")
+    print("    Bhagwad guides the programmer toward computational enlightenment.'")
+    print()
+    
+    if len(argv) < 2:
+        print("Usage:")
+        print("  python bhagwad.py <file.bhagwad>     # Execute file")
+        print("  python bhagwad.py -c <file.bhagwad>  # Compile to Python")
+        print("  python bhagwad.py -d <file.bhagwad>  # Debug mode")
+        print("  python bhagwad.py -i                 # Interactive mode")
+        print("  python bhagwad.py --examples         # Run example programs")
+        print()
+        print("Example files:")
+        if os.path.isdir(EXAMPLES_DIR):
+            for file in list_examples():
+                print(f"  examples/{file}")
+        return
+    
+    interpreter = BhagwadInterpreter()
+    
+    if argv[1] == '--examples':
+        # Run all example programs
+        if not os.path.isdir(EXAMPLES_DIR):
+            print("❌ Examples directory not found")
+            return
+        
+        for example_file in list_examples():
+            filepath = os.path.join(EXAMPLES_DIR, example_file)
+            print(f"\n{'='*60}")
+            print(f"🌟 Running: {example_file}")
+            print(f"{'='*60}")
+            
+            try:
+                interpreter.execute_file(filepath)
+            except Exception as e:
+                print(f"❌ Error in {example_file}: {e}")
+        
+        print(f"\n{'='*60}")
+        print("🙏 All examples completed. Om Shanti.")
+        return
+    
+    elif argv[1] == '-i':
+        # Interactive mode
+        print("🕉️  Bhagwad Interactive Mode")
+        print("Enter Bhagwad code (type 'exit' to quit, 'help' for commands):")
+        
+        while True:
+            try:
+                line = input("bhagwad> ")
+                
+                if line.strip() == 'exit':
+                    print("🙏 Om Shanti. May your code bring enlightenment.")
+                    break
+                elif line.strip() == 'help':
+                    print("Commands:")
+                    print("  exit     - Quit interpreter")
+                    print("  help     - Show this help")
+                    print("  debug on - Enable debug mode")
+                    print("  debug off- Disable debug mode")
+                    continue
+                elif line.strip() == 'debug on':
+                    interpreter.set_debug(True)
+                    print("🔍 Debug mode enabled")
+                    continue
+                elif line.strip() == 'debug off':
+                    interpreter.set_debug(False)
+                    print("🔇 Debug mode disabled")
+                    continue
+                
+                if line.strip():
+                    interpreter.execute_source(line)
+                    
+            except KeyboardInterrupt:
+                print("\n🙏 Om Shanti. May your code bring enlightenment.")
+                break
+            except Exception as e:
+                print(f"❌ Error: {e}")
+    
+    elif argv[1] == '-c':
+        # Compile mode
+        if len(argv) < 3:
+            print("❌ Please specify a .bhagwad file to compile")
+            return
+        
+        source_file = argv[2]
+        output_file = argv[3] if len(argv) > 3 else None
+        
+        try:
+            interpreter.set_debug(True)
+            result = interpreter.compile_to_file(source_file, output_file)
+            print(f"✨ Compilation successful: {result}")
+        except Exception as e:
+            print(f"❌ Compilation failed: {e}")
+    
+    elif argv[1] == '-d':
+        # Debug mode
+        if len(argv) < 3:
+            print("❌ Please specify a .bhagwad file to execute")
+            return
+        
+        source_file = argv[2]
+        
+        try:
+            interpreter.set_debug(True)
+            interpreter.execute_file(source_file)
+        except Exception as e:
+            print(f"❌ Execution failed: {e}")
+    
+    else:
+        # Normal execution mode
+        source_file = argv[1]
+        
+        try:
+            interpreter.execute_file(source_file)
+        except Exception as e:
+            print(f"❌ Execution failed: {e}")
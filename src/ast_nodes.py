@@ -9,145 +9,183 @@ from typing import List, Optional, Any, Union
 from dataclasses import dataclass
 
 # Base AST Node
-class ASTNode(ABC):
-    pass
+class ASTNode:
+    __slots__ = ()
 
 # Expressions
 class Expression(ASTNode):
-    pass
+    __slots__ = ()
 
+@dataclass(slots=True, eq=False)
 class Literal(Expression):
-    def __init__(self, value: Any, data_type: str):
-        self.value = value
-        self.data_type = data_type
+    value: Any
+    data_type: str
 
+@dataclass(slots=True, eq=False)
 class Identifier(Expression):
-    def __init__(self, name: str):
-        self.name = name
+    name: str
 
+@dataclass(slots=True, eq=False)
 class BinaryOperation(Expression):
-    def __init__(self, left: Expression, operator: str, right: Expression):
-        self.left = left
-        self.operator = operator
-        self.right = right
+    left: Expression
+    operator: str
+    right: Expression
 
+@dataclass(slots=True, eq=False)
+class BinaryChain(Expression):
+    """Three or more operands joined left to right by one associative operator"""
+    operator: str
+    operands: List[Expression]
+
+@dataclass(slots=True, eq=False)
 class UnaryOperation(Expression):
-    def __init__(self, operator: str, operand: Expression):
-        self.operator = operator
-        self.operand = operand
+    operator: str
+    operand: Expression
 
+@dataclass(slots=True, eq=False)
 class FunctionCall(Expression):
-    def __init__(self, name: str, arguments: List[Expression]):
-        self.name = name
-        self.arguments = arguments
+    name: str
+    arguments: List[Expression]
 
+@dataclass(slots=True, eq=False)
 class ArrayAccess(Expression):
-    def __init__(self, array: Expression, index: Expression):
-        self.array = array
-        self.index = index
+    array: Expression
+    index: Expression
 
+@dataclass(slots=True, eq=False)
 class ArrayLiteral(Expression):
-    def __init__(self, elements: List[Expression]):
-        self.elements = elements
+    elements: List[Expression]
 
+@dataclass(slots=True, eq=False)
 class MemberAccess(Expression):
-    def __init__(self, object: Expression, member: str):
-        self.object = object
-        self.member = member
+    object: Expression
+    member: str
 
 # Statements
 class Statement(ASTNode):
-    pass
+    __slots__ = ()
 
+@dataclass(slots=True, eq=False)
 class Block(Statement):
-    def __init__(self, statements: List[Statement]):
-        self.statements = statements
+    """Stores the statements list it is given as is, without copying it;
+    the parser hands over the list it built and never touches it again"""
+    statements: List[Statement]
 
+@dataclass(slots=True, eq=False)
 class VariableDeclaration(Statement):
     """Maya (variable) or Sankalpa (constant) declaration"""
-    def __init__(self, name: str, data_type: Optional[str], value: Optional[Expression], is_constant: bool = False):
-        self.name = name
-        self.data_type = data_type
-        self.value = value
-        self.is_constant = is_constant
+    name: str
+    data_type: Optional[str]
+    value: Optional[Expression]
+    is_constant: bool = False
 
+@dataclass(slots=True, eq=False)
 class Assignment(Statement):
-    def __init__(self, target: str, value: Expression):
-        self.target = target
-        self.value = value
+    target: str
+    value: Expression
 
+@dataclass(slots=True, eq=False)
 class Manifest(Statement):
     """Print/output statement"""
-    def __init__(self, expression: Expression):
-        self.expression = expression
+    expression: Expression
 
+@dataclass(slots=True, eq=False)
 class Dharma(Statement):
     """If-else condition"""
-    def __init__(self, condition: Expression, then_block: Block, else_block: Optional[Block] = None):
-        self.condition = condition
-        self.then_block = then_block
-        self.else_block = else_block
+    condition: Expression
+    then_block: Block
+    else_block: Optional[Block] = None
 
+@dataclass(slots=True, eq=False)
 class Karma(Statement):
     """Loop statement"""
-    def __init__(self, loop_type: str, variable: Optional[str] = None, 
-                 start: Optional[Expression] = None, end: Optional[Expression] = None,
-                 iterable: Optional[Expression] = None, body: Optional[Block] = None):
-        self.loop_type = loop_type  # "range" or "foreach"
-        self.variable = variable
-        self.start = start
-        self.end = end
-        self.iterable = iterable
-        self.body = body
+    loop_type: str  # "range" or "foreach"
+    variable: Optional[str] = None
+    start: Optional[Expression] = None
+    end: Optional[Expression] = None
+    iterable: Optional[Expression] = None
+    body: Optional[Block] = None
 
+@dataclass(slots=True, eq=False)
 class Moksha(Statement):
     """Return statement"""
-    def __init__(self, expression: Optional[Expression] = None):
-        self.expression = expression
+    expression: Optional[Expression] = None
 
+@dataclass(slots=True, eq=False)
 class Shloka(Statement):
     """Function definition"""
-    def __init__(self, name: str, parameters: List['Parameter'], return_type: Optional[str], body: Block):
-        self.name = name
-        self.parameters = parameters
-        self.return_type = return_type
-        self.body = body
+    name: str
+    parameters: List['Parameter']
+    return_type: Optional[str]
+    body: Block
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Parameter:
     name: str
     data_type: str
 
+@dataclass(slots=True, eq=False)
 class Arjuna(Statement):
     """Main function block"""
-    def __init__(self, body: Block):
-        self.body = body
+    body: Block
 
+@dataclass(slots=True, eq=False)
 class Yuga(Statement):
     """Module/namespace definition"""
-    def __init__(self, name: str, body: Block):
-        self.name = name
-        self.body = body
+    name: str
+    body: Block
 
+@dataclass(slots=True, eq=False)
 class Meditation(Statement):
     """Try-catch block"""
-    def __init__(self, try_block: Block, catch_variable: Optional[str] = None, catch_block: Optional[Block] = None):
-        self.try_block = try_block
-        self.catch_variable = catch_variable
-        self.catch_block = catch_block
+    try_block: Block
+    catch_variable: Optional[str] = None
+    catch_block: Optional[Block] = None
 
+@dataclass(slots=True, eq=False)
 class ExpressionStatement(Statement):
     """Statement that wraps an expression"""
-    def __init__(self, expression: Expression):
-        self.expression = expression
+    expression: Expression
 
 # Program root
+@dataclass(slots=True, eq=False)
 class Program(ASTNode):
-    def __init__(self, statements: List[Statement]):
-        self.statements = statements
+    """Owns its statements list the same way Block does"""
+    statements: List[Statement]
 
 # AST Visitor Pattern for traversal
 class ASTVisitor(ABC):
+    """Names the visit_* method for each node type; subclasses dispatch on it"""
+    
+    # Lets visitors that declare __slots__ go without an instance dict
+    __slots__ = ()
+    
+    # Method visited for each node type
+    VISIT_METHODS = {
+        Program: 'visit_program',
+        Literal: 'visit_literal',
+        Identifier: 'visit_identifier',
+        BinaryOperation: 'visit_binary_operation',
+        BinaryChain: 'visit_binary_chain',
+        UnaryOperation: 'visit_unary_operation',
+        FunctionCall: 'visit_function_call',
+        ArrayAccess: 'visit_array_access',
+        ArrayLiteral: 'visit_array_literal',
+        MemberAccess: 'visit_member_access',
+        Block: 'visit_block',
+        VariableDeclaration: 'visit_variable_declaration',
+        Assignment: 'visit_assignment',
+        Manifest: 'visit_manifest',
+        Dharma: 'visit_dharma',
+        Karma: 'visit_karma',
+        Moksha: 'visit_moksha',
+        Shloka: 'visit_shloka',
+        Arjuna: 'visit_arjuna',
+        Yuga: 'visit_yuga',
+        Meditation: 'visit_meditation',
+        ExpressionStatement: 'visit_expression_statement',
+    }
+    
     @abstractmethod
     def visit_program(self, node: Program):
         pass
@@ -164,6 +202,10 @@ class ASTVisitor(ABC):
     def visit_binary_operation(self, node: BinaryOperation):
         pass
     
+    @abstractmethod
+    def visit_binary_chain(self, node: BinaryChain):
+        pass
+    
     @abstractmethod
     def visit_unary_operation(self, node: UnaryOperation):
         pass
@@ -180,6 +222,10 @@ class ASTVisitor(ABC):
     def visit_array_literal(self, node: ArrayLiteral):
         pass
     
+    @abstractmethod
+    def visit_member_access(self, node: MemberAccess):
+        pass
+    
     @abstractmethod
     def visit_block(self, node: Block):
         pass
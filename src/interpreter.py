@@ -6,14 +6,49 @@ Inspired by the Bhagavad Gītā
 
 import sys
 import os
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
 from .lexer import BhagwadLexer
 from .parser import BhagwadParser, ParseError
 from .transpiler import transpile_bhagwad
 
+# Number of transpiled sources remembered per interpreter
+TRANSPILE_CACHE_SIZE = 128
+
+# Number of compiled files remembered per interpreter
+CODE_CACHE_SIZE = 128
+
+def _lru_get(cache: OrderedDict, key):
+    """Look up key in an LRU cache and mark it recently used"""
+    value = cache.get(key)
+    if value is not None:
+        try:
+            cache.move_to_end(key)
+        except KeyError:
+            pass  # Evicted by another thread since the lookup
+    return value
+
+def _lru_put(cache: OrderedDict, key, value, size: int):
+    """Store value as the newest entry, evicting the oldest beyond size.
+    
+    Each step is a single OrderedDict operation, so callers sharing an
+    interpreter across threads need no lock; losing an entry to a
+    concurrent eviction only costs a recompile.
+    """
+    cache[key] = value
+    try:
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+    except KeyError:
+        pass  # Another thread evicted the same entries first
+
 class BhagwadInterpreter:
     def __init__(self):
         self.debug = False
+        self._code_cache: OrderedDict[str, tuple] = OrderedDict()
+        self._transpile_cache: OrderedDict[bytes, str] = OrderedDict()
     
     def set_debug(self, debug: bool):
         """Enable/disable debug output"""
@@ -34,20 +69,31 @@ class BhagwadInterpreter:
     
     def interpret_source(self, source: str) -> str:
         """Interpret Bhagwad source code and return Python code"""
+        # surrogatepass so sources with lone surrogates (as stdin yields
+        # under a C locale) hash instead of raising
+        key = blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        if not self.debug:
+            cached = _lru_get(self._transpile_cache, key)
+            if cached is not None:
+                return cached
+        
         try:
             # Lexical analysis
             if self.debug:
                 print("🕉️  Starting lexical analysis...")
             
             lexer = BhagwadLexer(source)
-            tokens = lexer.tokenize()
             
             if self.debug:
+                tokens = lexer.tokenize()
                 print(f"📿 Generated {len(tokens)} tokens")
                 for token in tokens[:10]:  # Show first 10 tokens
                     print(f"   {token}")
                 if len(tokens) > 10:
                     print("   ...")
+            else:
+                # The parser pulls tokens from the lexer as it needs them
+                tokens = lexer.iter_tokens()
             
             # Syntax analysis
             if self.debug:
@@ -68,6 +114,8 @@ class BhagwadInterpreter:
             if self.debug:
                 print("🙏 Transpilation complete")
             
+            _lru_put(self._transpile_cache, key, python_code, TRANSPILE_CACHE_SIZE)
+            
             return python_code
             
         except ParseError as e:
@@ -84,7 +132,21 @@ class BhagwadInterpreter:
     
     def execute_file(self, filepath: str):
         """Execute a .bhagwad file directly"""
-        python_code = self.interpret_file(filepath)
+        # Reuse the compiled code object while the file is unchanged; the
+        # size catches edits within one tick of a coarse-grained mtime
+        try:
+            stat = os.stat(filepath)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        cached = _lru_get(self._code_cache, filepath)
+        if cached is not None and cached[0] == stamp:
+            _, python_code, code = cached
+        else:
+            # Raises for a missing file, so no entry is stored without a stamp
+            python_code = self.interpret_file(filepath)
+            code = compile(python_code, filepath, 'exec')
+            _lru_put(self._code_cache, filepath, (stamp, python_code, code), CODE_CACHE_SIZE)
         
         if self.debug:
             print("🌟 Generated Python code:")
@@ -94,7 +156,7 @@ class BhagwadInterpreter:
             print("🏃 Executing...")
         
         # Execute the generated Python code
-        exec(python_code)
+        exec(code, {'__name__': '__main__'})
     
     def execute_source(self, source: str):
         """Execute Bhagwad source code directly"""
@@ -108,7 +170,8 @@ class BhagwadInterpreter:
             print("🏃 Executing...")
         
         # Execute the generated Python code
-        exec(python_code)
+        code = compile(python_code, '<bhagwad>', 'exec')
+        exec(code, {'__name__': '__main__'})
     
     def compile_to_file(self, source_file: str, output_file: str = None):
         """Compile .bhagwad file to .py file"""
@@ -127,94 +190,8 @@ class BhagwadInterpreter:
 
 def main():
     """Command line interface for Bhagwad interpreter"""
-    if len(sys.argv) < 2:
-        print("🕉️  Bhagwad Programming Language")
-        print("Inspired by the Bhagavad Gītā")
-        print()
-        print("Usage:")
-        print("  python -m bhagwad <file.bhagwad>     # Execute file")
-        print("  python -m bhagwad -c <file.bhagwad>  # Compile to Python")
-        print("  python -m bhagwad -d <file.bhagwad>  # Debug mode")
-        print("  python -m bhagwad -i                 # Interactive mode")
-        return
-    
-    interpreter = BhagwadInterpreter()
-    
-    if sys.argv[1] == '-i':
-        # Interactive mode
-        print("🕉️  Bhagwad Interactive Mode")
-        print("Enter Bhagwad code (type 'exit' to quit, 'help' for commands):")
-        
-        while True:
-            try:
-                line = input("bhagwad> ")
-                
-                if line.strip() == 'exit':
-                    print("🙏 Om Shanti. May your code bring enlightenment.")
-                    break
-                elif line.strip() == 'help':
-                    print("Commands:")
-                    print("  exit     - Quit interpreter")
-                    print("  help     - Show this help")
-                    print("  debug on - Enable debug mode")
-                    print("  debug off- Disable debug mode")
-                    continue
-                elif line.strip() == 'debug on':
-                    interpreter.set_debug(True)
-                    print("🔍 Debug mode enabled")
-                    continue
-                elif line.strip() == 'debug off':
-                    interpreter.set_debug(False)
-                    print("🔇 Debug mode disabled")
-                    continue
-                
-                if line.strip():
-                    interpreter.execute_source(line)
-                    
-            except KeyboardInterrupt:
-                print("\n🙏 Om Shanti. May your code bring enlightenment.")
-                break
-            except Exception as e:
-                print(f"❌ Error: {e}")
-    
-    elif sys.argv[1] == '-c':
-        # Compile mode
-        if len(sys.argv) < 3:
-            print("❌ Please specify a .bhagwad file to compile")
-            return
-        
-        source_file = sys.argv[2]
-        output_file = sys.argv[3] if len(sys.argv) > 3 else None
-        
-        try:
-            interpreter.set_debug(True)
-            result = interpreter.compile_to_file(source_file, output_file)
-            print(f"✨ Compilation successful: {result}")
-        except Exception as e:
-            print(f"❌ Compilation failed: {e}")
-    
-    elif sys.argv[1] == '-d':
-        # Debug mode
-        if len(sys.argv) < 3:
-            print("❌ Please specify a .bhagwad file to execute")
-            return
-        
-        source_file = sys.argv[2]
-        
-        try:
-            interpreter.set_debug(True)
-            interpreter.execute_file(source_file)
-        except Exception as e:
-            print(f"❌ Execution failed: {e}")
-    
-    else:
-        # Normal execution mode
-        source_file = sys.argv[1]
-        
-        try:
-            interpreter.execute_file(source_file)
-        except Exception as e:
-            print(f"❌ Execution failed: {e}")
+    from ._cli import run
+    run(sys.argv)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,292 +5,250 @@ Inspired by the Bhagavad Gītā
 """
 
 import re
-from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional, Iterator
+from sys import intern
+from enum import IntEnum, auto
+from typing import List, NamedTuple, Iterator
 
-class TokenType(Enum):
+# Integer members hash and compare in C, which keeps the parser's token
+# type checks and dict lookups cheap
+class TokenType(IntEnum):
     # Keywords (Spiritual constructs)
-    SHLOKA = "SHLOKA"           # function
-    DHARMA = "DHARMA"           # if
-    ADHARMA = "ADHARMA"         # else
-    KARMA = "KARMA"             # loop
-    ARJUNA = "ARJUNA"           # main
-    MANIFEST = "MANIFEST"       # print
-    MOKSHA = "MOKSHA"           # return
-    MAYA = "MAYA"               # variable
-    SANKALPA = "SANKALPA"       # constant
-    YUGA = "YUGA"               # module/namespace
-    MEDITATION = "MEDITATION"   # try
-    DISTURBANCE = "DISTURBANCE" # catch
-    COSMIC = "COSMIC"           # array
+    SHLOKA = auto()             # function
+    DHARMA = auto()             # if
+    ADHARMA = auto()            # else
+    KARMA = auto()              # loop
+    ARJUNA = auto()             # main
+    MANIFEST = auto()           # print
+    MOKSHA = auto()             # return
+    MAYA = auto()               # variable
+    SANKALPA = auto()           # constant
+    YUGA = auto()               # module/namespace
+    MEDITATION = auto()         # try
+    DISTURBANCE = auto()        # catch
+    COSMIC = auto()             # array
     
     # Data types (Gunas)
-    SATTVA = "SATTVA"           # int
-    RAJAS = "RAJAS"             # string
-    TAMAS = "TAMAS"             # bool
+    SATTVA = auto()             # int
+    RAJAS = auto()              # string
+    TAMAS = auto()              # bool
     
     # Literals
-    NUMBER = "NUMBER"
-    STRING = "STRING"
-    BOOLEAN = "BOOLEAN"
-    IDENTIFIER = "IDENTIFIER"
+    NUMBER = auto()
+    STRING = auto()
+    BOOLEAN = auto()
+    IDENTIFIER = auto()
     
     # Operators
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    MULTIPLY = "MULTIPLY"
-    DIVIDE = "DIVIDE"
-    MODULO = "MODULO"
-    ASSIGN = "ASSIGN"
-    EQUALS = "EQUALS"
-    NOT_EQUALS = "NOT_EQUALS"
-    LESS_THAN = "LESS_THAN"
-    GREATER_THAN = "GREATER_THAN"
-    LESS_EQUAL = "LESS_EQUAL"
-    GREATER_EQUAL = "GREATER_EQUAL"
+    PLUS = auto()
+    MINUS = auto()
+    MULTIPLY = auto()
+    DIVIDE = auto()
+    MODULO = auto()
+    ASSIGN = auto()
+    EQUALS = auto()
+    NOT_EQUALS = auto()
+    LESS_THAN = auto()
+    GREATER_THAN = auto()
+    LESS_EQUAL = auto()
+    GREATER_EQUAL = auto()
     
     # Delimiters
-    LEFT_PAREN = "LEFT_PAREN"
-    RIGHT_PAREN = "RIGHT_PAREN"
-    LEFT_BRACE = "LEFT_BRACE"
-    RIGHT_BRACE = "RIGHT_BRACE"
-    LEFT_BRACKET = "LEFT_BRACKET"
-    RIGHT_BRACKET = "RIGHT_BRACKET"
-    COMMA = "COMMA"
-    SEMICOLON = "SEMICOLON"
-    ARROW = "ARROW"
-    DOT = "DOT"
+    LEFT_PAREN = auto()
+    RIGHT_PAREN = auto()
+    LEFT_BRACE = auto()
+    RIGHT_BRACE = auto()
+    LEFT_BRACKET = auto()
+    RIGHT_BRACKET = auto()
+    COMMA = auto()
+    SEMICOLON = auto()
+    ARROW = auto()
+    DOT = auto()
     
     # Control flow
-    FROM = "FROM"
-    TO = "TO"
-    IN = "IN"
+    FROM = auto()
+    TO = auto()
+    IN = auto()
     
     # Special
-    NEWLINE = "NEWLINE"
-    EOF = "EOF"
-    COMMENT = "COMMENT"
+    NEWLINE = auto()
+    EOF = auto()
+    COMMENT = auto()
 
-@dataclass
-class Token:
+class Token(NamedTuple):
     type: TokenType
     value: str
     line: int
     column: int
 
+# Keywords mapping, shared by every lexer instance
+_KEYWORDS = {
+    'shloka': TokenType.SHLOKA,
+    'dharma': TokenType.DHARMA,
+    'adharma': TokenType.ADHARMA,
+    'karma': TokenType.KARMA,
+    'arjuna': TokenType.ARJUNA,
+    'manifest': TokenType.MANIFEST,
+    'moksha': TokenType.MOKSHA,
+    'maya': TokenType.MAYA,
+    'sankalpa': TokenType.SANKALPA,
+    'yuga': TokenType.YUGA,
+    'meditation': TokenType.MEDITATION,
+    'disturbance': TokenType.DISTURBANCE,
+    'cosmic': TokenType.COSMIC,
+    'sattva': TokenType.SATTVA,
+    'rajas': TokenType.RAJAS,
+    'tamas': TokenType.TAMAS,
+    'from': TokenType.FROM,
+    'to': TokenType.TO,
+    'in': TokenType.IN,
+    'true': TokenType.BOOLEAN,
+    'false': TokenType.BOOLEAN,
+}
+
+# Operators and delimiters; two-character operators are tried before their
+# single-character prefixes by the master pattern below.
+_OPERATORS = {
+    '==': TokenType.EQUALS,
+    '!=': TokenType.NOT_EQUALS,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '->': TokenType.ARROW,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '%': TokenType.MODULO,
+    '=': TokenType.ASSIGN,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    '[': TokenType.LEFT_BRACKET,
+    ']': TokenType.RIGHT_BRACKET,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    '.': TokenType.DOT,
+}
+
+# Master scanner: a single alternation so the regex engine does the
+# character dispatch for the whole source in one pass. Leading blanks are
+# consumed by the pattern itself, so every match is a token. String groups
+# stop before the closing quote, which is optional so that an unterminated
+# string still runs to the end of the source.
+_MASTER_RE = re.compile(r'''
+    [ \t\r]*
+    (?:
+      (?P<COMMENT>//[^\n]*)
+    | (?P<STRING>"(?:\\[\s\S]|[^"\\])*)"?
+    | (?P<SQ_STRING>'(?:\\[\s\S]|[^'\\])*)'?
+    | (?P<NUMBER>\d[\d.]*)
+    | (?P<IDENT>[^\W\d]\w*)
+    | (?P<OP>==|!=|<=|>=|->|[-+*/%=<>(){}\[\],;.])
+    | (?P<NL>\n)
+    | (?P<ERROR>[^ \t\r])
+    )
+''', re.VERBOSE)
+
+# Group numbers of the master pattern; tokenize dispatches on m.lastindex
+(_COMMENT, _STRING, _SQ_STRING, _NUMBER,
+ _IDENT, _OP, _NL, _ERROR) = (_MASTER_RE.groupindex[name] for name in (
+    'COMMENT', 'STRING', 'SQ_STRING', 'NUMBER', 'IDENT', 'OP', 'NL', 'ERROR'))
+
+_ESCAPE_CHARS = {
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    '\\': '\\',
+    '"': '"',
+    "'": "'"
+}
+
+_ESCAPE_RE = re.compile(r'\\([\s\S])')
+
+def _replace_escape(match) -> str:
+    char = match.group(1)
+    return _ESCAPE_CHARS.get(char, char)
+
+def _unescape(value: str) -> str:
+    """Resolve backslash escapes; unknown escapes yield the escaped character"""
+    return _ESCAPE_RE.sub(_replace_escape, value)
+
 class BhagwadLexer:
-    def __init__(self, source: str):
+    def __init__(self, source: str, skip_comments: bool = True):
         self.source = source
+        self.skip_comments = skip_comments
         self.position = 0
         self.line = 1
         self.column = 1
         self.tokens: List[Token] = []
         
-        # Keywords mapping
-        self.keywords = {
-            'shloka': TokenType.SHLOKA,
-            'dharma': TokenType.DHARMA,
-            'adharma': TokenType.ADHARMA,
-            'karma': TokenType.KARMA,
-            'arjuna': TokenType.ARJUNA,
-            'manifest': TokenType.MANIFEST,
-            'moksha': TokenType.MOKSHA,
-            'maya': TokenType.MAYA,
-            'sankalpa': TokenType.SANKALPA,
-            'yuga': TokenType.YUGA,
-            'meditation': TokenType.MEDITATION,
-            'disturbance': TokenType.DISTURBANCE,
-            'cosmic': TokenType.COSMIC,
-            'sattva': TokenType.SATTVA,
-            'rajas': TokenType.RAJAS,
-            'tamas': TokenType.TAMAS,
-            'from': TokenType.FROM,
-            'to': TokenType.TO,
-            'in': TokenType.IN,
-            'true': TokenType.BOOLEAN,
-            'false': TokenType.BOOLEAN,
-        }
-    
-    def current_char(self) -> Optional[str]:
-        if self.position >= len(self.source):
-            return None
-        return self.source[self.position]
-    
-    def peek_char(self, offset: int = 1) -> Optional[str]:
-        peek_pos = self.position + offset
-        if peek_pos >= len(self.source):
-            return None
-        return self.source[peek_pos]
-    
-    def advance(self) -> None:
-        if self.position < len(self.source) and self.source[self.position] == '\n':
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        self.position += 1
+        self.keywords = _KEYWORDS
     
-    def skip_whitespace(self) -> None:
-        while self.current_char() and self.current_char() in ' \t\r':
-            self.advance()
-    
-    def read_string(self) -> str:
-        quote_char = self.current_char()
-        self.advance()  # Skip opening quote
-        
-        value = ""
-        while self.current_char() and self.current_char() != quote_char:
-            if self.current_char() == '\\':
-                self.advance()
-                if self.current_char() in '"\'\\nrt':
-                    escape_chars = {
-                        'n': '\n',
-                        'r': '\r',
-                        't': '\t',
-                        '\\': '\\',
-                        '"': '"',
-                        "'": "'"
-                    }
-                    value += escape_chars.get(self.current_char(), self.current_char())
-                else:
-                    value += self.current_char()
-            else:
-                value += self.current_char()
-            self.advance()
-        
-        if self.current_char() == quote_char:
-            self.advance()  # Skip closing quote
-        
-        return value
-    
-    def read_number(self) -> str:
-        value = ""
-        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-            value += self.current_char()
-            self.advance()
-        return value
-    
-    def read_identifier(self) -> str:
-        value = ""
-        while (self.current_char() and 
-               (self.current_char().isalnum() or self.current_char() == '_')):
-            value += self.current_char()
-            self.advance()
-        return value
+    def tokenize(self) -> List[Token]:
+        self.tokens.extend(self.iter_tokens())
+        return self.tokens
     
-    def read_comment(self) -> str:
-        comment = ""
-        self.advance()  # Skip first /
-        self.advance()  # Skip second /
+    def iter_tokens(self) -> Iterator[Token]:
+        """Yield tokens as they are scanned, ending with EOF"""
+        source = self.source
+        keywords = self.keywords
+        line, line_start = 1, 0
         
-        while self.current_char() and self.current_char() != '\n':
-            comment += self.current_char()
-            self.advance()
-        
-        return comment.strip()
-    
-    def tokenize(self) -> List[Token]:
-        while self.position < len(self.source):
-            self.skip_whitespace()
-            
-            if not self.current_char():
-                break
-            
-            char = self.current_char()
-            line, column = self.line, self.column
-            
-            # Comments
-            if char == '/' and self.peek_char() == '/':
-                comment = self.read_comment()
-                self.tokens.append(Token(TokenType.COMMENT, comment, line, column))
-                continue
+        for m in _MASTER_RE.finditer(source):
+            kind = m.lastindex
+            start = m.start(kind)
+            column = start - line_start + 1
             
             # Newlines
-            if char == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, char, line, column))
-                self.advance()
+            if kind == _NL:
+                yield Token(TokenType.NEWLINE, "\n", line, column)
+                line += 1
+                line_start = m.end()
                 continue
             
-            # Strings
-            if char in '"\'':
-                value = self.read_string()
-                self.tokens.append(Token(TokenType.STRING, value, line, column))
-                continue
-            
-            # Numbers
-            if char.isdigit():
-                value = self.read_number()
-                self.tokens.append(Token(TokenType.NUMBER, value, line, column))
-                continue
+            text = m.group(kind)
             
             # Identifiers and keywords
-            if char.isalpha() or char == '_':
-                value = self.read_identifier()
-                token_type = self.keywords.get(value.lower(), TokenType.IDENTIFIER)
-                self.tokens.append(Token(token_type, value, line, column))
-                continue
-            
-            # Two-character operators
-            if char == '=' and self.peek_char() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.EQUALS, "==", line, column))
-                continue
-            
-            if char == '!' and self.peek_char() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.NOT_EQUALS, "!=", line, column))
-                continue
-            
-            if char == '<' and self.peek_char() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.LESS_EQUAL, "<=", line, column))
-                continue
+            if kind == _IDENT:
+                token_type = keywords.get(text.lower(), TokenType.IDENTIFIER)
+                # Names repeat throughout a program; interning shares one
+                # string per name across the tokens and the AST built on them
+                yield Token(token_type, intern(text), line, column)
             
-            if char == '>' and self.peek_char() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.GREATER_EQUAL, ">=", line, column))
-                continue
+            # Operators and delimiters
+            elif kind == _OP:
+                # Shared like names, so every '==' in the AST is one object
+                yield Token(_OPERATORS[text], intern(text), line, column)
             
-            if char == '-' and self.peek_char() == '>':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.ARROW, "->", line, column))
-                continue
+            elif kind == _NUMBER:
+                yield Token(TokenType.NUMBER, text, line, column)
             
-            # Single-character tokens
-            single_chars = {
-                '+': TokenType.PLUS,
-                '-': TokenType.MINUS,
-                '*': TokenType.MULTIPLY,
-                '/': TokenType.DIVIDE,
-                '%': TokenType.MODULO,
-                '=': TokenType.ASSIGN,
-                '<': TokenType.LESS_THAN,
-                '>': TokenType.GREATER_THAN,
-                '(': TokenType.LEFT_PAREN,
-                ')': TokenType.RIGHT_PAREN,
-                '{': TokenType.LEFT_BRACE,
-                '}': TokenType.RIGHT_BRACE,
-                '[': TokenType.LEFT_BRACKET,
-                ']': TokenType.RIGHT_BRACKET,
-                ',': TokenType.COMMA,
-                ';': TokenType.SEMICOLON,
-                '.': TokenType.DOT,
-            }
+            # Strings (the group excludes the closing quote)
+            elif kind == _STRING or kind == _SQ_STRING:
+                value = text[1:]
+                if '\\' in value:
+                    value = _unescape(value)
+                yield Token(TokenType.STRING, value, line, column)
+                
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rindex('\n') + 1
             
-            if char in single_chars:
-                self.tokens.append(Token(single_chars[char], char, line, column))
-                self.advance()
-                continue
+            # Comments carry no meaning for the parser and are only kept on request
+            elif kind == _COMMENT:
+                if not self.skip_comments:
+                    yield Token(TokenType.COMMENT, text[2:].strip(), line, column)
             
             # Unknown character
-            raise SyntaxError(f"Unexpected character '{char}' at line {line}, column {column}")
+            else:
+                raise SyntaxError(f"Unexpected character '{text}' at line {line}, column {column}")
+        
+        self.position = len(source)
+        self.line = line
+        self.column = len(source) - line_start + 1
         
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
-        return self.tokens
\ No newline at end of file
+        yield Token(TokenType.EOF, "", self.line, self.column)
@@ -4,136 +4,238 @@ Converts tokens into Abstract Syntax Tree (AST)
 Inspired by the Bhagavad Gītā
 """
 
-from typing import List, Optional, Union
+from typing import Any, FrozenSet, Generator, Iterable, List, Optional, Union
 from .lexer import Token, TokenType, BhagwadLexer
-from .ast_nodes import *
+from .ast_nodes import (
+    ASTNode, Expression, Statement, Literal, Identifier, BinaryOperation,
+    BinaryChain, UnaryOperation, FunctionCall, ArrayAccess, ArrayLiteral,
+    MemberAccess, Block, VariableDeclaration, Assignment, Manifest, Dharma,
+    Karma, Moksha, Shloka, Parameter, Arjuna, Yuga, Meditation,
+    ExpressionStatement, Program,
+)
+
+# Binding power of binary operators; all of them are left-associative
+PRECEDENCE = {
+    TokenType.EQUALS: 1,
+    TokenType.NOT_EQUALS: 1,
+    TokenType.GREATER_THAN: 2,
+    TokenType.GREATER_EQUAL: 2,
+    TokenType.LESS_THAN: 2,
+    TokenType.LESS_EQUAL: 2,
+    TokenType.PLUS: 3,
+    TokenType.MINUS: 3,
+    TokenType.MULTIPLY: 4,
+    TokenType.DIVIDE: 4,
+    TokenType.MODULO: 4,
+}
+
+# Operators whose runs like a + b + c are collected into one BinaryChain
+_CHAIN_OPERATORS = frozenset({'+', '*'})
+
+_EOF = TokenType.EOF
+_NEWLINE = TokenType.NEWLINE
+_COMMA = TokenType.COMMA
+
+# A compound statement or block being parsed by drive(): it yields child
+# frames and is sent back each child's finished node
+_Frame = Generator[Any, Any, Any]
+
+# Stands in for EOF when a token stream ends without one
+_END = Token(_EOF, "", 0, 0)
+
+# Keywords that name a primitive type
+_TYPE_TOKENS = frozenset({TokenType.SATTVA, TokenType.RAJAS, TokenType.TAMAS})
+
+# Keywords that start a statement; error recovery resumes at them
+_SYNC_TYPES = frozenset({
+    TokenType.ARJUNA, TokenType.SHLOKA, TokenType.YUGA,
+    TokenType.MAYA, TokenType.SANKALPA, TokenType.MANIFEST,
+    TokenType.DHARMA, TokenType.KARMA, TokenType.MOKSHA,
+})
+
+# Shared nodes for the literals programs use most; nothing downstream
+# mutates a Literal, so one instance can stand in for every occurrence
+_SMALL_INTS = tuple(Literal(i, 'sattva') for i in range(257))
+_TRUE = Literal(True, 'tamas')
+_FALSE = Literal(False, 'tamas')
 
 class ParseError(Exception):
     def __init__(self, message: str, token: Token):
         self.message = message
         self.token = token
-        super().__init__(f"{message} at line {token.line}, column {token.column}")
+        super().__init__(message)
+    
+    def __str__(self):
+        # Formatted on demand; most parse errors are never printed
+        return f"{self.message} at line {self.token.line}, column {self.token.column}"
 
 class BhagwadParser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.current = 0
+    __slots__ = ('_tokens', '_prev', '_cur', '_next')
+    
+    def __init__(self, tokens: Iterable[Token]):
+        # Tokens are pulled from the iterable as parsing reaches them, so
+        # the lexer can stream them instead of building a list first
+        self._tokens = iter(tokens)
+        self._prev = _END
+        self._cur = next(self._tokens, _END)
+        self._next = self._cur if self._cur.type is _EOF else next(self._tokens, _END)
     
     def peek(self) -> Token:
         """Get current token without consuming it"""
-        if self.current >= len(self.tokens):
-            return self.tokens[-1]  # EOF token
-        return self.tokens[self.current]
+        return self._cur
     
     def previous(self) -> Token:
         """Get previous token"""
-        return self.tokens[self.current - 1]
+        return self._prev
     
     def advance(self) -> Token:
         """Consume current token and move to next"""
-        if not self.is_at_end():
-            self.current += 1
-        return self.previous()
+        token = self._cur
+        if token.type is not _EOF:
+            self._prev = token
+            self._cur = token = self._next
+            # Stop reading once EOF is buffered; it stays current from then on
+            if token.type is not _EOF:
+                self._next = next(self._tokens, _END)
+        return self._prev
     
     def is_at_end(self) -> bool:
         """Check if we're at end of tokens"""
-        return self.peek().type == TokenType.EOF
+        return self._cur.type is _EOF
     
     def check(self, token_type: TokenType) -> bool:
         """Check if current token is of given type"""
-        if self.is_at_end():
-            return False
-        return self.peek().type == token_type
+        current_type = self._cur.type
+        return current_type == token_type and current_type is not _EOF
     
     def match(self, *token_types: TokenType) -> bool:
         """Check if current token matches any of the given types"""
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
-                return True
+        current_type = self._cur.type
+        if current_type in token_types and current_type is not _EOF:
+            self.advance()
+            return True
+        return False
+    
+    def match_one(self, token_type: TokenType) -> bool:
+        """Fast path of match() for a single token type"""
+        if self._cur.type is token_type and token_type is not _EOF:
+            self.advance()
+            return True
+        return False
+    
+    def match_in(self, token_types: FrozenSet[TokenType]) -> bool:
+        """Like match() for a prebuilt set of token types"""
+        current_type = self._cur.type
+        if current_type in token_types and current_type is not _EOF:
+            self.advance()
+            return True
         return False
     
     def consume(self, token_type: TokenType, message: str) -> Token:
         """Consume token of expected type or raise error"""
-        if self.check(token_type):
-            return self.advance()
-        raise ParseError(message, self.peek())
+        token = self._cur
+        if token.type == token_type and token.type is not _EOF:
+            self.advance()
+            return token
+        raise ParseError(message, token)
     
     def skip_newlines(self):
         """Skip newline tokens"""
-        while self.match(TokenType.NEWLINE):
-            pass
+        advance = self.advance
+        while self._cur.type is _NEWLINE:
+            advance()
     
     def parse(self) -> Program:
         """Parse tokens into AST"""
-        statements = []
-        
-        while not self.is_at_end():
-            self.skip_newlines()
-            if not self.is_at_end():
-                stmt = self.statement()
-                if stmt:
-                    statements.append(stmt)
-            self.skip_newlines()
+        statements: List[Statement] = []
+        append = statements.append
+        is_at_end = self.is_at_end
+        skip_newlines = self.skip_newlines
+        statement = self.statement
+        
+        skip_newlines()
+        while not is_at_end():
+            stmt = statement()
+            if stmt is not None:
+                append(stmt)
+            skip_newlines()
         
         return Program(statements)
     
     def statement(self) -> Optional[Statement]:
         """Parse a statement"""
-        try:
-            if self.match(TokenType.ARJUNA):
-                return self.arjuna_statement()
-            elif self.match(TokenType.SHLOKA):
-                return self.shloka_statement()
-            elif self.match(TokenType.YUGA):
-                return self.yuga_statement()
-            elif self.match(TokenType.MAYA, TokenType.SANKALPA):
-                return self.variable_declaration()
-            elif self.match(TokenType.SATTVA, TokenType.RAJAS, TokenType.TAMAS):
-                return self.typed_variable_declaration()
-            elif self.match(TokenType.COSMIC):
-                return self.array_declaration()
-            elif self.match(TokenType.MANIFEST):
-                return self.manifest_statement()
-            elif self.match(TokenType.DHARMA):
-                return self.dharma_statement()
-            elif self.match(TokenType.KARMA):
-                return self.karma_statement()
-            elif self.match(TokenType.MOKSHA):
-                return self.moksha_statement()
-            elif self.match(TokenType.MEDITATION):
-                return self.meditation_statement()
-            elif self.check(TokenType.IDENTIFIER):
-                return self.assignment_or_expression()
-            elif self.match(TokenType.COMMENT):
-                return None  # Skip comments
+        stmt = self.statement_frame()
+        if stmt is not None and not isinstance(stmt, ASTNode):
+            stmt = self.drive(stmt)
+        return stmt
+    
+    def statement_frame(self):
+        """Parse a simple statement, or start a frame for a compound one"""
+        token_type = self.peek().type
+        handler = _STATEMENT_HANDLERS.get(token_type)
+        if handler is not None:
+            self.advance()
+            return handler(self)
+        elif token_type is TokenType.IDENTIFIER:
+            return self.assignment_or_expression()
+        elif self.match_one(TokenType.COMMENT):
+            return None  # Skip comments
+        else:
+            raise ParseError(f"Unexpected token: {self.peek().value}", self.peek())
+    
+    def drive(self, frame: _Frame) -> Any:
+        """Run a frame and every frame it opens on an explicit stack.
+        
+        A frame yields the child frame whose node it needs next and is
+        resumed with that node once the child has returned, so nesting
+        depth costs a list entry instead of a Python stack frame.
+        """
+        stack = [frame]
+        push = stack.append
+        pop = stack.pop
+        node = None
+        while True:
+            try:
+                child = stack[-1].send(node)
+            except StopIteration as done:
+                pop()
+                node = done.value
+                if not stack:
+                    return node
             else:
-                raise ParseError(f"Unexpected token: {self.peek().value}", self.peek())
-        except ParseError as e:
-            # Error recovery - skip to next statement
-            self.synchronize()
-            raise e
+                push(child)
+                node = None
     
     def synchronize(self):
-        """Recover from parse error by finding next statement"""
+        """Recover from parse error by finding next statement.
+        
+        Parse errors propagate to the caller; one that wants to keep going
+        calls this before parsing the next statement.
+        """
         self.advance()
         while not self.is_at_end():
-            if self.previous().type == TokenType.NEWLINE:
+            if self._prev.type is _NEWLINE:
                 return
-            if self.peek().type in [TokenType.ARJUNA, TokenType.SHLOKA, TokenType.YUGA, 
-                                   TokenType.MAYA, TokenType.SANKALPA, TokenType.MANIFEST,
-                                   TokenType.DHARMA, TokenType.KARMA, TokenType.MOKSHA]:
+            if self._cur.type in _SYNC_TYPES:
                 return
             self.advance()
     
     def arjuna_statement(self) -> Arjuna:
         """Parse arjuna (main) block"""
+        return self.drive(self._arjuna_frame())
+    
+    def _arjuna_frame(self) -> Generator[_Frame, Block, Arjuna]:
+        """Frame for arjuna_statement(); see drive()"""
         self.consume(TokenType.LEFT_BRACE, "Expected '{' after 'arjuna'")
-        body = self.block()
+        body = yield self.block_frame()
         return Arjuna(body)
     
     def shloka_statement(self) -> Shloka:
         """Parse shloka (function) definition"""
+        return self.drive(self._shloka_frame())
+    
+    def _shloka_frame(self) -> Generator[_Frame, Block, Shloka]:
+        """Frame for shloka_statement(); see drive()"""
         name = self.consume(TokenType.IDENTIFIER, "Expected function name").value
         
         self.consume(TokenType.LEFT_PAREN, "Expected '(' after function name")
@@ -145,14 +247,14 @@ class BhagwadParser:
         self.consume(TokenType.RIGHT_PAREN, "Expected ')' after parameters")
         
         return_type = None
-        if self.match(TokenType.ARROW):
-            if self.match(TokenType.SATTVA, TokenType.RAJAS, TokenType.TAMAS):
+        if self.match_one(TokenType.ARROW):
+            if self.match_in(_TYPE_TOKENS):
                 return_type = self.previous().value
             else:
                 raise ParseError("Expected return type after '->'", self.peek())
         
         self.consume(TokenType.LEFT_BRACE, "Expected '{' before function body")
-        body = self.block()
+        body = yield self.block_frame()
         
         return Shloka(name, parameters, return_type, body)
     
@@ -166,7 +268,9 @@ class BhagwadParser:
         parameters.append(Parameter(param_name, param_type))
         
         # Additional parameters
-        while self.match(TokenType.COMMA):
+        advance = self.advance
+        while self._cur.type is _COMMA:
+            advance()
             param_type = self.consume_type("Expected parameter type")
             param_name = self.consume(TokenType.IDENTIFIER, "Expected parameter name").value
             parameters.append(Parameter(param_name, param_type))
@@ -175,9 +279,9 @@ class BhagwadParser:
     
     def consume_type(self, message: str) -> str:
         """Consume a type token"""
-        if self.match(TokenType.SATTVA, TokenType.RAJAS, TokenType.TAMAS):
+        if self.match_in(_TYPE_TOKENS):
             return self.previous().value
-        elif self.match(TokenType.COSMIC):
+        elif self.match_one(TokenType.COSMIC):
             # Handle cosmic array type
             array_type = self.consume_type("Expected array element type after 'cosmic'")
             self.consume(TokenType.LEFT_BRACKET, "Expected '[' after array type")
@@ -187,9 +291,13 @@ class BhagwadParser:
     
     def yuga_statement(self) -> Yuga:
         """Parse yuga (module) definition"""
+        return self.drive(self._yuga_frame())
+    
+    def _yuga_frame(self) -> Generator[_Frame, Block, Yuga]:
+        """Frame for yuga_statement(); see drive()"""
         name = self.consume(TokenType.IDENTIFIER, "Expected module name").value
         self.consume(TokenType.LEFT_BRACE, "Expected '{' after module name")
-        body = self.block()
+        body = yield self.block_frame()
         return Yuga(name, body)
     
     def variable_declaration(self) -> VariableDeclaration:
@@ -198,10 +306,10 @@ class BhagwadParser:
         
         name = self.consume(TokenType.IDENTIFIER, "Expected variable name").value
         
-        data_type = None
-        value = None
+        data_type: Optional[str] = None
+        value: Optional[Expression] = None
         
-        if self.match(TokenType.ASSIGN):
+        if self.match_one(TokenType.ASSIGN):
             value = self.expression()
         
         return VariableDeclaration(name, data_type, value, is_constant)
@@ -212,7 +320,7 @@ class BhagwadParser:
         name = self.consume(TokenType.IDENTIFIER, "Expected variable name").value
         
         value = None
-        if self.match(TokenType.ASSIGN):
+        if self.match_one(TokenType.ASSIGN):
             value = self.expression()
         
         return VariableDeclaration(name, data_type, value, False)
@@ -226,7 +334,7 @@ class BhagwadParser:
         name = self.consume(TokenType.IDENTIFIER, "Expected array name").value
         
         value = None
-        if self.match(TokenType.ASSIGN):
+        if self.match_one(TokenType.ASSIGN):
             value = self.expression()
         
         return VariableDeclaration(name, f"{array_type}[]", value, False)
@@ -238,41 +346,52 @@ class BhagwadParser:
     
     def dharma_statement(self) -> Dharma:
         """Parse dharma (if-else) statement"""
+        return self.drive(self._dharma_frame())
+    
+    def _dharma_frame(self) -> Generator[_Frame, Block, Dharma]:
+        """Frame for dharma_statement(); see drive()"""
         self.consume(TokenType.LEFT_PAREN, "Expected '(' after 'dharma'")
         condition = self.expression()
         self.consume(TokenType.RIGHT_PAREN, "Expected ')' after condition")
         
         self.consume(TokenType.LEFT_BRACE, "Expected '{' after condition")
-        then_block = self.block()
+        then_block = yield self.block_frame()
         
         else_block = None
-        if self.match(TokenType.ADHARMA):
+        if self.match_one(TokenType.ADHARMA):
             self.consume(TokenType.LEFT_BRACE, "Expected '{' after 'adharma'")
-            else_block = self.block()
+            else_block = yield self.block_frame()
         
         return Dharma(condition, then_block, else_block)
     
     def karma_statement(self) -> Karma:
         """Parse karma (loop) statement"""
+        return self.drive(self._karma_frame())
+    
+    def _karma_frame(self) -> Generator[_Frame, Block, Karma]:
+        """Frame for karma_statement(); see drive()"""
         if self.check(TokenType.IDENTIFIER):
             variable = self.advance().value
             
-            if self.match(TokenType.FROM):
+            token_type = self._cur.type
+            if token_type is TokenType.FROM:
+                self.advance()
                 # karma i from 1 to 10
                 start = self.expression()
                 self.consume(TokenType.TO, "Expected 'to' after start value")
                 end = self.expression()
                 
                 self.consume(TokenType.LEFT_BRACE, "Expected '{' after loop range")
-                body = self.block()
+                body = yield self.block_frame()
                 
                 return Karma("range", variable, start, end, None, body)
-            elif self.match(TokenType.IN):
+            elif token_type is TokenType.IN:
+                self.advance()
                 # karma num in array
                 iterable = self.expression()
                 
                 self.consume(TokenType.LEFT_BRACE, "Expected '{' after iterable")
-                body = self.block()
+                body = yield self.block_frame()
                 
                 return Karma("foreach", variable, None, None, iterable, body)
             else:
@@ -289,107 +408,89 @@ class BhagwadParser:
     
     def meditation_statement(self) -> Meditation:
         """Parse meditation (try-catch) statement"""
+        return self.drive(self._meditation_frame())
+    
+    def _meditation_frame(self) -> Generator[_Frame, Block, Meditation]:
+        """Frame for meditation_statement(); see drive()"""
         self.consume(TokenType.LEFT_BRACE, "Expected '{' after 'meditation'")
-        try_block = self.block()
+        try_block = yield self.block_frame()
         
         catch_variable = None
         catch_block = None
         
-        if self.match(TokenType.DISTURBANCE):
+        if self.match_one(TokenType.DISTURBANCE):
             self.consume(TokenType.LEFT_PAREN, "Expected '(' after 'disturbance'")
             catch_variable = self.consume(TokenType.IDENTIFIER, "Expected error variable name").value
             self.consume(TokenType.RIGHT_PAREN, "Expected ')' after error variable")
             
             self.consume(TokenType.LEFT_BRACE, "Expected '{' after disturbance clause")
-            catch_block = self.block()
+            catch_block = yield self.block_frame()
         
         return Meditation(try_block, catch_variable, catch_block)
     
     def assignment_or_expression(self) -> Statement:
         """Parse assignment or expression statement"""
-        if self.check(TokenType.IDENTIFIER):
+        # Look past the name for '=' rather than consuming it and backing up
+        if self._cur.type is TokenType.IDENTIFIER and self._next.type is TokenType.ASSIGN:
             name = self.advance().value
-            if self.match(TokenType.ASSIGN):
-                value = self.expression()
-                return Assignment(name, value)
-            else:
-                # Put the identifier back and parse as expression
-                self.current -= 1
-                expr = self.expression()
-                return ExpressionStatement(expr)
-        else:
-            expr = self.expression()
-            return ExpressionStatement(expr)
+            self.advance()
+            value = self.expression()
+            return Assignment(name, value)
+        
+        expr = self.expression()
+        return ExpressionStatement(expr)
     
     def block(self) -> Block:
         """Parse block of statements"""
-        statements = []
-        
-        self.skip_newlines()
-        
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            self.skip_newlines()
-            if not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-                stmt = self.statement()
-                if stmt:
-                    statements.append(stmt)
-            self.skip_newlines()
+        return self.drive(self.block_frame())
+    
+    def block_frame(self) -> Generator[_Frame, Any, Block]:
+        """_Frame parsing a block's statements; see drive()"""
+        statements: List[Statement] = []
+        append = statements.append
+        check = self.check
+        is_at_end = self.is_at_end
+        skip_newlines = self.skip_newlines
+        statement_frame = self.statement_frame
+        
+        skip_newlines()
+        
+        while not check(TokenType.RIGHT_BRACE) and not is_at_end():
+            stmt = statement_frame()
+            if stmt is not None and not isinstance(stmt, ASTNode):
+                stmt = yield stmt
+            if stmt is not None:
+                append(stmt)
+            skip_newlines()
         
         self.consume(TokenType.RIGHT_BRACE, "Expected '}' after block")
         return Block(statements)
     
     def expression(self) -> Expression:
         """Parse expression"""
-        return self.equality()
-    
-    def equality(self) -> Expression:
-        """Parse equality expressions"""
-        expr = self.comparison()
-        
-        while self.match(TokenType.EQUALS, TokenType.NOT_EQUALS):
-            operator = self.previous().value
-            right = self.comparison()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def comparison(self) -> Expression:
-        """Parse comparison expressions"""
-        expr = self.term()
-        
-        while self.match(TokenType.GREATER_THAN, TokenType.GREATER_EQUAL, 
-                         TokenType.LESS_THAN, TokenType.LESS_EQUAL):
-            operator = self.previous().value
-            right = self.term()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def term(self) -> Expression:
-        """Parse addition and subtraction"""
-        expr = self.factor()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.previous().value
-            right = self.factor()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
+        return self.binary(1)
     
-    def factor(self) -> Expression:
-        """Parse multiplication and division"""
+    def binary(self, min_precedence: int) -> Expression:
+        """Parse binary operators binding at least as tightly as min_precedence"""
         expr = self.unary()
         
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            operator = self.previous().value
-            right = self.unary()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
+        while True:
+            precedence = PRECEDENCE.get(self.peek().type, 0)
+            if precedence < min_precedence:
+                return expr
+            operator = self.advance().value
+            right = self.binary(precedence + 1)
+            if type(expr) is BinaryChain and expr.operator == operator:
+                expr.operands.append(right)
+            elif (type(expr) is BinaryOperation and expr.operator == operator
+                    and operator in _CHAIN_OPERATORS):
+                expr = BinaryChain(operator, [expr.left, expr.right, right])
+            else:
+                expr = BinaryOperation(expr, operator, right)
     
     def unary(self) -> Expression:
         """Parse unary expressions"""
-        if self.match(TokenType.MINUS):
+        if self.match_one(TokenType.MINUS):
             operator = self.previous().value
             right = self.unary()
             return UnaryOperation(operator, right)
@@ -400,16 +501,20 @@ class BhagwadParser:
         """Parse function calls, array access, and member access"""
         expr = self.primary()
         
+        advance = self.advance
         while True:
-            if self.match(TokenType.LEFT_PAREN):
+            token_type = self._cur.type
+            if token_type is TokenType.LEFT_PAREN:
+                advance()
                 expr = self.finish_call(expr)
-            elif self.match(TokenType.LEFT_BRACKET):
+            elif token_type is TokenType.LEFT_BRACKET:
+                advance()
                 index = self.expression()
                 self.consume(TokenType.RIGHT_BRACKET, "Expected ']' after array index")
                 expr = ArrayAccess(expr, index)
-            elif self.match(TokenType.DOT):
+            elif token_type is TokenType.DOT:
+                advance()
                 member = self.consume(TokenType.IDENTIFIER, "Expected member name after '.'").value
-                from .ast_nodes import MemberAccess
                 expr = MemberAccess(expr, member)
             else:
                 break
@@ -418,59 +523,88 @@ class BhagwadParser:
     
     def finish_call(self, callee: Expression) -> Expression:
         """Parse function call arguments"""
-        arguments = []
+        arguments: List[Expression] = []
         
         if not self.check(TokenType.RIGHT_PAREN):
-            arguments.append(self.expression())
-            while self.match(TokenType.COMMA):
-                arguments.append(self.expression())
+            append = arguments.append
+            expression = self.expression
+            advance = self.advance
+            append(expression())
+            while self._cur.type is _COMMA:
+                advance()
+                append(expression())
         
         self.consume(TokenType.RIGHT_PAREN, "Expected ')' after arguments")
         
-        if isinstance(callee, Identifier):
+        if type(callee) is Identifier:
             return FunctionCall(callee.name, arguments)
         else:
             raise ParseError("Invalid function call", self.peek())
     
     def primary(self) -> Expression:
         """Parse primary expressions"""
-        if self.match(TokenType.BOOLEAN):
-            value = self.previous().value.lower() == 'true'
-            return Literal(value, 'tamas')
+        if self.match_one(TokenType.BOOLEAN):
+            return _TRUE if self.previous().value.lower() == 'true' else _FALSE
         
-        if self.match(TokenType.NUMBER):
+        if self.match_one(TokenType.NUMBER):
             value = self.previous().value
             if '.' in value:
                 return Literal(float(value), 'sattva')
-            else:
-                return Literal(int(value), 'sattva')
+            number = int(value)
+            if number <= 256:
+                return _SMALL_INTS[number]
+            return Literal(number, 'sattva')
         
-        if self.match(TokenType.STRING):
+        if self.match_one(TokenType.STRING):
             return Literal(self.previous().value, 'rajas')
         
-        if self.match(TokenType.IDENTIFIER):
+        if self.match_one(TokenType.IDENTIFIER):
             return Identifier(self.previous().value)
         
-        if self.match(TokenType.LEFT_PAREN):
+        if self.match_one(TokenType.LEFT_PAREN):
             expr = self.expression()
             self.consume(TokenType.RIGHT_PAREN, "Expected ')' after expression")
             return expr
         
-        if self.match(TokenType.LEFT_BRACKET):
-            elements = []
+        if self.match_one(TokenType.LEFT_BRACKET):
+            elements: List[Expression] = []
             if not self.check(TokenType.RIGHT_BRACKET):
-                elements.append(self.expression())
-                while self.match(TokenType.COMMA):
-                    elements.append(self.expression())
+                append = elements.append
+                expression = self.expression
+                advance = self.advance
+                append(expression())
+                while self._cur.type is _COMMA:
+                    advance()
+                    append(expression())
             
             self.consume(TokenType.RIGHT_BRACKET, "Expected ']' after array elements")
             return ArrayLiteral(elements)
         
         raise ParseError(f"Unexpected token: {self.peek().value}", self.peek())
 
+# Statement parsers keyed by the keyword that introduces them; the
+# keyword is consumed before the handler runs. Handlers for statements
+# with a body are their frame generators, which yield a block frame for
+# drive()
+_STATEMENT_HANDLERS = {
+    TokenType.ARJUNA: BhagwadParser._arjuna_frame,
+    TokenType.SHLOKA: BhagwadParser._shloka_frame,
+    TokenType.YUGA: BhagwadParser._yuga_frame,
+    TokenType.MAYA: BhagwadParser.variable_declaration,
+    TokenType.SANKALPA: BhagwadParser.variable_declaration,
+    TokenType.SATTVA: BhagwadParser.typed_variable_declaration,
+    TokenType.RAJAS: BhagwadParser.typed_variable_declaration,
+    TokenType.TAMAS: BhagwadParser.typed_variable_declaration,
+    TokenType.COSMIC: BhagwadParser.array_declaration,
+    TokenType.MANIFEST: BhagwadParser.manifest_statement,
+    TokenType.DHARMA: BhagwadParser._dharma_frame,
+    TokenType.KARMA: BhagwadParser._karma_frame,
+    TokenType.MOKSHA: BhagwadParser.moksha_statement,
+    TokenType.MEDITATION: BhagwadParser._meditation_frame,
+}
+
 def parse_bhagwad(source: str) -> Program:
     """Parse Bhagwad source code into AST"""
     lexer = BhagwadLexer(source)
-    tokens = lexer.tokenize()
-    parser = BhagwadParser(tokens)
+    parser = BhagwadParser(lexer.iter_tokens())
     return parser.parse()
\ No newline at end of file
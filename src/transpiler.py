@@ -4,83 +4,197 @@ Converts Bhagwad AST to executable Python code
 Inspired by the Bhagavad Gītā
 """
 
-from typing import Any
-from .ast_nodes import *
+import io
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+from .ast_nodes import (
+    ASTVisitor, Expression, Statement, Literal, Identifier, BinaryOperation,
+    BinaryChain, UnaryOperation, FunctionCall, ArrayAccess, ArrayLiteral,
+    MemberAccess, Block, VariableDeclaration, Assignment, Manifest, Dharma,
+    Karma, Moksha, Shloka, Arjuna, Yuga, Meditation, ExpressionStatement,
+    Program,
+)
+
+# Generator of a compound statement visitor or of block_frame(); see drive()
+_Frame = Iterator[Any]
+
+# Python type names for Bhagwad types
+_TYPE_MAP = {
+    'sattva': 'int',
+    'rajas': 'str',
+    'tamas': 'bool',
+    'sattva[]': 'List[int]',
+    'rajas[]': 'List[str]',
+    'tamas[]': 'List[bool]'
+}
+
+# Type comment lines of typed declarations, rendered once per type
+_TYPE_COMMENTS = {bhagwad_type: f"# Type: {python_type}"
+                  for bhagwad_type, python_type in _TYPE_MAP.items()}
+
+# Initial values for declarations without one
+_DEFAULTS: Dict[Optional[str], str] = {
+    'sattva': '0',
+    'rajas': '""',
+    'tamas': 'False',
+    'sattva[]': '[]',
+    'rajas[]': '[]',
+    'tamas[]': '[]'
+}
+
+# Characters that would end or break a double-quoted Python string
+_STRING_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+def _format_string(value: str) -> str:
+    return '"' + value.translate(_STRING_ESCAPES) + '"'
+
+def _format_bool(value: bool) -> str:
+    return "True" if value else "False"
+
+# Source text of the integers the parser shares Literal nodes for
+_SMALL_INT_STRS = tuple(str(i) for i in range(257))
+
+def _format_number(value: Any) -> str:
+    # bool is an int subclass, hence the exact type check
+    if type(value) is int and 0 <= value <= 256:
+        return _SMALL_INT_STRS[value]
+    return repr(value)
+
+# Python source for a literal value by its Bhagwad type; anything else uses str()
+_LITERAL_FORMATS: Dict[str, Callable[[Any], str]] = {
+    'rajas': _format_string,   # string
+    'tamas': _format_bool,     # boolean
+    'sattva': _format_number,  # number
+}
+
+# Header comment of every generated file, up to the blank line after it
+_HEADER = "\n".join((
+    "#!/usr/bin/env python3",
+    '"""',
+    "Generated from Bhagwad Programming Language",
+    "Inspired by the Bhagavad Gītā",
+    '"""',
+    "",
+))
+
+# Newline plus indentation by level, extended as deeper code is emitted.
+# Every line after the header is written with its newline in front, so the
+# generated source ends without one
+_LINE_STARTS = ["\n"]
+
+def _line_start(level: int) -> str:
+    """Line separator and indentation for a nesting level, from the shared cache"""
+    starts = _LINE_STARTS
+    while len(starts) <= level:
+        starts.append(starts[-1] + "    ")
+    return starts[level]
+
+# Frame generators of compound statements, dispatched in place of their
+# visit_* methods so drive() can run nested bodies without recursing
+_FRAME_METHODS = {
+    Dharma: '_dharma_frame',
+    Karma: '_karma_frame',
+    Shloka: '_shloka_frame',
+    Arjuna: '_arjuna_frame',
+    Yuga: '_yuga_frame',
+    Meditation: '_meditation_frame',
+}
 
 class BhagwadTranspiler(ASTVisitor):
+    __slots__ = ('output', 'indent_level', '_stmt_dispatch', '_expr_dispatch')
+    
     def __init__(self):
-        self.output = []
+        self.output = io.StringIO()
         self.indent_level = 0
-    
-    def indent(self) -> str:
-        """Get current indentation"""
-        return "    " * self.indent_level
+        # Bound visit methods keyed by exact node type, split by role
+        self._stmt_dispatch = {node_type: getattr(self, name)
+                               for node_type, name in self.VISIT_METHODS.items()
+                               if issubclass(node_type, Statement)}
+        self._stmt_dispatch.update({node_type: getattr(self, name)
+                                    for node_type, name in _FRAME_METHODS.items()})
+        self._expr_dispatch = {node_type: getattr(self, name)
+                               for node_type, name in self.VISIT_METHODS.items()
+                               if issubclass(node_type, Expression)}
     
     def emit(self, code: str):
         """Emit code with proper indentation"""
         if code.strip():
-            self.output.append(self.indent() + code)
+            self.output.write(f"{_line_start(self.indent_level)}{code}")
         else:
-            self.output.append("")
+            self.output.write("\n")
+    
+    def emit_multi(self, lines: Iterable[str]):
+        """Emit several non-blank lines at the current indentation"""
+        start = _line_start(self.indent_level)
+        self.output.write(start + start.join(lines))
     
-    def emit_raw(self, code: str):
-        """Emit code without indentation"""
-        self.output.append(code)
+    def render(self) -> str:
+        """Source text emitted so far"""
+        return self.output.getvalue()
     
     def transpile(self, ast: Program) -> str:
         """Transpile AST to Python code"""
-        self.output = []
+        # Start from the header comment
+        self.output = io.StringIO()
+        self.output.write(_HEADER)
         self.indent_level = 0
         
-        # Add header comment
-        self.emit_raw("#!/usr/bin/env python3")
-        self.emit_raw('"""')
-        self.emit_raw("Generated from Bhagwad Programming Language")
-        self.emit_raw("Inspired by the Bhagavad Gītā")
-        self.emit_raw('"""')
-        self.emit_raw("")
-        
         self.visit_program(ast)
-        return "\n".join(self.output)
+        return self.render()
     
     def visit_program(self, node: Program):
+        visit_statement = self.visit_statement
+        write = self.output.write
         for statement in node.statements:
-            self.visit_statement(statement)
-            self.emit("")
+            visit_statement(statement)
+            write("\n")
     
     def visit_statement(self, node: Statement):
-        if isinstance(node, Arjuna):
-            self.visit_arjuna(node)
-        elif isinstance(node, Shloka):
-            self.visit_shloka(node)
-        elif isinstance(node, Yuga):
-            self.visit_yuga(node)
-        elif isinstance(node, VariableDeclaration):
-            self.visit_variable_declaration(node)
-        elif isinstance(node, Assignment):
-            self.visit_assignment(node)
-        elif isinstance(node, Manifest):
-            self.visit_manifest(node)
-        elif isinstance(node, Dharma):
-            self.visit_dharma(node)
-        elif isinstance(node, Karma):
-            self.visit_karma(node)
-        elif isinstance(node, Moksha):
-            self.visit_moksha(node)
-        elif isinstance(node, Meditation):
-            self.visit_meditation(node)
-        elif isinstance(node, Block):
-            self.visit_block(node)
-        elif isinstance(node, ExpressionStatement):
-            self.visit_expression_statement(node)
+        handler = self._stmt_dispatch.get(type(node))
+        if handler is not None:
+            frame = handler(node)
+            if frame is not None:
+                self.drive(frame)
+    
+    def drive(self, frame: _Frame):
+        """Visit a compound statement and everything nested in it.
+        
+        Frames of statements with a body (see _FRAME_METHODS) emit their
+        header, yield each Block when its lines are due and emit the rest
+        once it is done. Blocks are opened here with block_frame(); nothing
+        is sent back, since every frame writes straight to the output. The
+        parser's drive() walks its frames the same way.
+        """
+        stack = [frame]
+        push = stack.append
+        pop = stack.pop
+        block_frame = self.block_frame
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                pop()
+            elif type(child) is Block:
+                push(block_frame(child))
+            else:
+                push(child)
+    
+    def block_frame(self, block: Block) -> _Frame:
+        """Frame visiting a block's statements; see drive()"""
+        dispatch = self._stmt_dispatch
+        for statement in block.statements:
+            handler = dispatch.get(type(statement))
+            if handler is not None:
+                frame = handler(statement)
+                if frame is not None:
+                    yield frame
     
     def visit_literal(self, node: Literal):
-        if node.data_type == 'rajas':  # string
-            return f'"{node.value}"'
-        elif node.data_type == 'tamas':  # boolean
-            return str(node.value).title()
-        else:  # sattva (number)
-            return str(node.value)
+        return _LITERAL_FORMATS.get(node.data_type, str)(node.value)
     
     def visit_identifier(self, node: Identifier):
         return node.name
@@ -88,31 +202,27 @@ class BhagwadTranspiler(ASTVisitor):
     def visit_binary_operation(self, node: BinaryOperation):
         left = self.visit_expression(node.left)
         right = self.visit_expression(node.right)
-        
-        # Map operators
-        op_map = {
-            '==': '==',
-            '!=': '!=',
-            '<': '<',
-            '>': '>',
-            '<=': '<=',
-            '>=': '>=',
-            '+': '+',
-            '-': '-',
-            '*': '*',
-            '/': '/',
-            '%': '%'
-        }
-        
-        operator = op_map.get(node.operator, node.operator)
-        return f"({left} {operator} {right})"
+        # Bhagwad operators are spelled the same as Python's
+        return f"({left} {node.operator} {right})"
+    
+    def visit_binary_chain(self, node: BinaryChain):
+        # Same nesting as the equivalent left-deep BinaryOperation tree, built
+        # with one join instead of re-copying the growing string per operand
+        operands = node.operands
+        visit_expression = self.visit_expression
+        separator = f" {node.operator} "
+        parts = ["(" * (len(operands) - 1), visit_expression(operands[0])]
+        for operand in operands[1:]:
+            parts.append(f"{separator}{visit_expression(operand)})")
+        return "".join(parts)
     
     def visit_unary_operation(self, node: UnaryOperation):
         operand = self.visit_expression(node.operand)
         return f"({node.operator}{operand})"
     
     def visit_function_call(self, node: FunctionCall):
-        args = [self.visit_expression(arg) for arg in node.arguments]
+        visit_expression = self.visit_expression
+        args = [visit_expression(arg) for arg in node.arguments]
         return f"{node.name}({', '.join(args)})"
     
     def visit_array_access(self, node: ArrayAccess):
@@ -121,37 +231,30 @@ class BhagwadTranspiler(ASTVisitor):
         return f"{array}[{index}]"
     
     def visit_array_literal(self, node: ArrayLiteral):
-        elements = [self.visit_expression(elem) for elem in node.elements]
+        visit_expression = self.visit_expression
+        elements = [visit_expression(elem) for elem in node.elements]
         return f"[{', '.join(elements)}]"
     
-    def visit_member_access(self, node):
+    def visit_member_access(self, node: MemberAccess):
         """Handle member access expressions like Module.function"""
         object_expr = self.visit_expression(node.object)
         return f"{object_expr}.{node.member}"
     
     def visit_expression(self, node: Expression) -> str:
-        if isinstance(node, Literal):
-            return self.visit_literal(node)
-        elif isinstance(node, Identifier):
-            return self.visit_identifier(node)
-        elif isinstance(node, BinaryOperation):
-            return self.visit_binary_operation(node)
-        elif isinstance(node, UnaryOperation):
-            return self.visit_unary_operation(node)
-        elif isinstance(node, FunctionCall):
-            return self.visit_function_call(node)
-        elif isinstance(node, ArrayAccess):
-            return self.visit_array_access(node)
-        elif isinstance(node, ArrayLiteral):
-            return self.visit_array_literal(node)
-        elif isinstance(node, MemberAccess):
-            return self.visit_member_access(node)
-        else:
+        handler = self._expr_dispatch.get(type(node))
+        if handler is None:
             raise ValueError(f"Unknown expression type: {type(node)}")
+        return handler(node)
     
     def visit_block(self, node: Block):
-        for statement in node.statements:
-            self.visit_statement(statement)
+        self.drive(self.block_frame(node))
+    
+    def emit_block_or_pass(self, block: Block) -> _Frame:
+        """Yield a block to visit, or emit pass if it has no statements"""
+        if block.statements:
+            yield block
+        else:
+            self.emit("pass")
     
     def visit_variable_declaration(self, node: VariableDeclaration):
         if node.value:
@@ -159,44 +262,26 @@ class BhagwadTranspiler(ASTVisitor):
             if node.is_constant:
                 # Constants in Python are just uppercase variables
                 name = node.name.upper()
-                self.emit(f"# Sankalpa (Constant): {node.name}")
-                self.emit(f"{name} = {value}")
-            else:
-                self.emit(f"# Maya (Variable): {node.name}")
-                if node.data_type:
-                    self.emit(f"# Type: {self.map_type(node.data_type)}")
-                self.emit(f"{node.name} = {value}")
+                self.emit_multi((f"# Sankalpa (Constant): {node.name}",
+                                 f"{name} = {value}"))
+                return
         else:
             # Uninitialized variable
-            default_val = self.get_default_value(node.data_type)
-            self.emit(f"# Maya (Variable): {node.name}")
-            if node.data_type:
-                self.emit(f"# Type: {self.map_type(node.data_type)}")
-            self.emit(f"{node.name} = {default_val}")
+            value = self.get_default_value(node.data_type)
+        
+        lines = [f"# Maya (Variable): {node.name}"]
+        if node.data_type:
+            lines.append(_TYPE_COMMENTS.get(node.data_type, "# Type: Any"))
+        lines.append(f"{node.name} = {value}")
+        self.emit_multi(lines)
     
     def map_type(self, bhagwad_type: str) -> str:
         """Map Bhagwad types to Python types"""
-        type_map = {
-            'sattva': 'int',
-            'rajas': 'str', 
-            'tamas': 'bool',
-            'sattva[]': 'List[int]',
-            'rajas[]': 'List[str]',
-            'tamas[]': 'List[bool]'
-        }
-        return type_map.get(bhagwad_type, 'Any')
-    
-    def get_default_value(self, bhagwad_type: str) -> str:
+        return _TYPE_MAP.get(bhagwad_type, 'Any')
+    
+    def get_default_value(self, bhagwad_type: Optional[str]) -> str:
         """Get default value for a type"""
-        defaults = {
-            'sattva': '0',
-            'rajas': '""',
-            'tamas': 'False',
-            'sattva[]': '[]',
-            'rajas[]': '[]',
-            'tamas[]': '[]'
-        }
-        return defaults.get(bhagwad_type, 'None')
+        return _DEFAULTS.get(bhagwad_type, 'None')
     
     def visit_assignment(self, node: Assignment):
         value = self.visit_expression(node.value)
@@ -207,36 +292,48 @@ class BhagwadTranspiler(ASTVisitor):
         self.emit(f"print({expr})  # Manifest: Make visible the invisible")
     
     def visit_dharma(self, node: Dharma):
+        self.drive(self._dharma_frame(node))
+    
+    def _dharma_frame(self, node: Dharma) -> _Frame:
         condition = self.visit_expression(node.condition)
-        self.emit(f"if {condition}:  # Dharma: Righteous path")
+        # Header lines are never blank, so they skip emit() and go straight
+        # to the output at the level the statement started on
+        write = self.output.write
+        level = self.indent_level
+        start = _line_start(level)
+        write(f"{start}if {condition}:  # Dharma: Righteous path")
         
-        self.indent_level += 1
-        self.visit_block(node.then_block)
+        self.indent_level = level + 1
+        yield node.then_block
         
         if node.else_block:
-            self.indent_level -= 1
-            self.emit("else:  # Adharma: Alternative path")
-            self.indent_level += 1
-            self.visit_block(node.else_block)
+            write(f"{start}else:  # Adharma: Alternative path")
+            yield node.else_block
         
-        self.indent_level -= 1
+        self.indent_level = level
     
     def visit_karma(self, node: Karma):
+        self.drive(self._karma_frame(node))
+    
+    def _karma_frame(self, node: Karma) -> _Frame:
+        # The parser fills in the fields its loop type uses
+        assert node.body is not None
+        level = self.indent_level
         if node.loop_type == "range":
+            assert node.start is not None and node.end is not None
             start = self.visit_expression(node.start)
             end = self.visit_expression(node.end)
-            self.emit(f"for {node.variable} in range({start}, {end} + 1):  # Karma: Cycle of action")
-            
-            self.indent_level += 1
-            self.visit_block(node.body)
-            self.indent_level -= 1
+            self.output.write(f"{_line_start(level)}for {node.variable} in range({start}, {end} + 1):  # Karma: Cycle of action")
         elif node.loop_type == "foreach":
+            assert node.iterable is not None
             iterable = self.visit_expression(node.iterable)
-            self.emit(f"for {node.variable} in {iterable}:  # Karma: Cycle through collection")
-            
-            self.indent_level += 1
-            self.visit_block(node.body)
-            self.indent_level -= 1
+            self.output.write(f"{_line_start(level)}for {node.variable} in {iterable}:  # Karma: Cycle through collection")
+        else:
+            return
+        
+        self.indent_level = level + 1
+        yield node.body
+        self.indent_level = level
     
     def visit_moksha(self, node: Moksha):
         if node.expression:
@@ -246,68 +343,73 @@ class BhagwadTranspiler(ASTVisitor):
             self.emit("return  # Moksha: Liberation")
     
     def visit_shloka(self, node: Shloka):
+        self.drive(self._shloka_frame(node))
+    
+    def _shloka_frame(self, node: Shloka) -> _Frame:
         # Function signature
-        params = []
-        for param in node.parameters:
-            params.append(f"{param.name}")
+        param_str = ", ".join([param.name for param in node.parameters])
+        level = self.indent_level
+        self.output.write(f"{_line_start(level)}def {node.name}({param_str}):  # Shloka: Verse of computational wisdom")
         
-        param_str = ", ".join(params)
-        self.emit(f"def {node.name}({param_str}):  # Shloka: Verse of computational wisdom")
+        # Docstring and body sit one level in
+        self.indent_level = level + 1
         
         # Add docstring with parameter types
         if node.parameters or node.return_type:
-            self.indent_level += 1
             self.emit('"""')
             if node.parameters:
                 self.emit("Parameters:")
-                for param in node.parameters:
-                    mapped_type = self.map_type(param.data_type)
-                    self.emit(f"    {param.name}: {mapped_type} ({param.data_type})")
+                map_type = self.map_type
+                self.emit_multi([f"    {param.name}: {map_type(param.data_type)} ({param.data_type})"
+                                 for param in node.parameters])
             if node.return_type:
                 mapped_return = self.map_type(node.return_type)
                 self.emit(f"Returns: {mapped_return} ({node.return_type})")
             self.emit('"""')
-            self.indent_level -= 1
         
         # Function body
-        self.indent_level += 1
-        if not node.body.statements:
-            self.emit("pass")
-        else:
-            self.visit_block(node.body)
-        self.indent_level -= 1
+        yield from self.emit_block_or_pass(node.body)
+        self.indent_level = level
     
     def visit_arjuna(self, node: Arjuna):
-        self.emit('if __name__ == "__main__":  # Arjuna: The eternal seeker begins the journey')
-        self.indent_level += 1
-        self.emit("# The battlefield of Kurukshetra - where computation meets consciousness")
-        if not node.body.statements:
-            self.emit("pass")
-        else:
-            self.visit_block(node.body)
-        self.indent_level -= 1
+        self.drive(self._arjuna_frame(node))
+    
+    def _arjuna_frame(self, node: Arjuna) -> _Frame:
+        level = self.indent_level
+        self.output.write(f'{_line_start(level)}if __name__ == "__main__":  # Arjuna: The eternal seeker begins the journey'
+                          f"{_line_start(level + 1)}# The battlefield of Kurukshetra - where computation meets consciousness")
+        self.indent_level = level + 1
+        yield from self.emit_block_or_pass(node.body)
+        self.indent_level = level
     
     def visit_yuga(self, node: Yuga):
-        self.emit(f"# Yuga: {node.name} - A cosmic age of functionality")
-        self.emit(f"class {node.name}:")
-        self.indent_level += 1
-        if not node.body.statements:
-            self.emit("pass")
-        else:
-            self.visit_block(node.body)
-        self.indent_level -= 1
+        self.drive(self._yuga_frame(node))
+    
+    def _yuga_frame(self, node: Yuga) -> _Frame:
+        level = self.indent_level
+        start = _line_start(level)
+        self.output.write(f"{start}# Yuga: {node.name} - A cosmic age of functionality"
+                          f"{start}class {node.name}:")
+        self.indent_level = level + 1
+        yield from self.emit_block_or_pass(node.body)
+        self.indent_level = level
     
     def visit_meditation(self, node: Meditation):
-        self.emit("try:  # Meditation: Focused awareness")
-        self.indent_level += 1
-        self.visit_block(node.try_block)
-        self.indent_level -= 1
+        self.drive(self._meditation_frame(node))
+    
+    def _meditation_frame(self, node: Meditation) -> _Frame:
+        write = self.output.write
+        level = self.indent_level
+        start = _line_start(level)
+        write(f"{start}try:  # Meditation: Focused awareness")
+        self.indent_level = level + 1
+        yield node.try_block
         
         if node.catch_block:
-            self.emit(f"except Exception as {node.catch_variable}:  # Disturbance: When the mind wavers")
-            self.indent_level += 1
-            self.visit_block(node.catch_block)
-            self.indent_level -= 1
+            write(f"{start}except Exception as {node.catch_variable}:  # Disturbance: When the mind wavers")
+            yield node.catch_block
+        
+        self.indent_level = level
     
     def visit_expression_statement(self, node: ExpressionStatement):
         expr = self.visit_expression(node.expression)